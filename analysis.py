@@ -1,98 +1,290 @@
-import json
+import ijson
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Dash, html, dcc, callback, Output, Input, State, ctx, ALL
-from collections import Counter
+import plotly.io as pio
+from dash import Dash, html, dcc, callback, Output, Input, State, ctx, dash_table
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from functools import lru_cache
+from waitress import serve
 import re
 import os
 import io
 import base64
+import pickle
 
 # Create output directory if it doesn't exist
 os.makedirs('visualizations', exist_ok=True)
 
-# Load the JSON data
-def load_data():
-    with open('final_exhibitor_info_translated.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data
+SOURCE_JSON = 'final_exhibitor_info_translated.json'
+VIZ_CACHE = '.viz_cache.pkl'
 
-# Process data for visualization
-def process_data(data):
-    # Extract relevant information
-    processed_data = []
-    
-    for exhibitor in data:
-        # 웹페이지 URL 추출
-        website_url = next((contact['url'] for contact in exhibitor.get('contact_details', []) 
-                          if contact.get('type', '').lower() == 'website'), '')
-        
-        item = {
-            'company_name': exhibitor.get('company_name', 'Unknown'),
-            'booth_location': exhibitor.get('booth_location', 'Unknown'),
-            'pavilion': exhibitor.get('pavilion', 'None'),
-            'categories_count': len(exhibitor.get('categories', [])),
-            'has_description': 1 if exhibitor.get('description_ko') else 0,
-            'social_media_count': len(exhibitor.get('social_media', [])),
-            'description': exhibitor.get('description', ''),
-            'description_ko': exhibitor.get('description_ko', ''),
-            'social_media': exhibitor.get('social_media', []),
-            'contact_details': exhibitor.get('contact_details', []),
-            'website': website_url,  # 웹페이지 URL 추가
-        }
-        
-        # Extract categories
-        item['categories'] = exhibitor.get('categories', [])
-        
-        # Add to processed data
-        processed_data.append(item)
-    
-    return processed_data
+# plotly가 콜백 응답(figure/component JSON)을 orjson으로 직렬화하도록 설정
+pio.json.config.default_engine = 'orjson'
+
+# Flask 쪽 jsonify 응답도 orjson으로 직렬화
+class ORJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# 언어 토글 버튼 스타일 — 클릭마다 dict를 새로 만들지 않도록 모듈 상수로 정의
+EN_ACTIVE_STYLE = {
+    'padding': '8px 15px',
+    'backgroundColor': '#4CAF50',
+    'color': 'white',
+    'border': 'none',
+    'borderRadius': '5px',
+    'cursor': 'pointer',
+    'fontWeight': 'bold',
+    'boxShadow': '0 2px 5px rgba(0,0,0,0.2)',
+    'transition': 'all 0.3s ease'
+}
+
+EN_INACTIVE_STYLE = {
+    'padding': '8px 15px',
+    'backgroundColor': '#ccc',
+    'color': 'black',
+    'border': 'none',
+    'borderRadius': '5px',
+    'cursor': 'pointer',
+    'fontWeight': 'bold',
+    'boxShadow': '0 2px 5px rgba(0,0,0,0.1)',
+    'transition': 'all 0.3s ease'
+}
+
+# 한글 버튼은 오른쪽 여백만 다르다
+KO_ACTIVE_STYLE = dict(EN_ACTIVE_STYLE, marginRight='10px')
+KO_INACTIVE_STYLE = dict(EN_INACTIVE_STYLE, marginRight='10px')
+
+DOWNLOAD_BTN_HIDDEN_STYLE = {'display': 'none'}
+DOWNLOAD_BTN_VISIBLE_STYLE = {'marginTop': '20px', 'display': 'block'}
+DOWNLOAD_BTN_STYLE = {'marginRight': '10px', 'padding': '12px 20px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer', 'fontWeight': 'bold', 'boxShadow': '0 2px 5px rgba(0,0,0,0.2)', 'transition': 'background-color 0.3s'}
+
+# 전시업체 DataTable 스타일 — 렌더링마다 재생성하지 않도록 한 번만 만든다
+TABLE_COLUMNS = [
+    {'name': 'Company Name', 'id': 'company_name'},
+    {'name': 'Booth Location', 'id': 'booth_location'},
+    {'name': 'Description', 'id': 'description'},
+    {'name': 'Homepage', 'id': 'website', 'presentation': 'markdown'},
+]
+TABLE_STYLE_HEADER = {'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'fontWeight': 'bold', 'textAlign': 'left'}
+TABLE_STYLE_CELL = {'padding': '10px', 'fontFamily': 'Arial, sans-serif', 'textAlign': 'left', 'whiteSpace': 'normal', 'height': 'auto', 'lineHeight': '1.5'}
+TABLE_STYLE_CELL_CONDITIONAL = [
+    {'if': {'column_id': 'company_name'}, 'width': '15%', 'fontWeight': 'bold'},
+    {'if': {'column_id': 'booth_location'}, 'width': '10%', 'textAlign': 'center'},
+    {'if': {'column_id': 'description'}, 'width': '65%'},
+    {'if': {'column_id': 'website'}, 'width': '10%', 'textAlign': 'center'},
+]
+TABLE_STYLE_DATA_CONDITIONAL = [{'if': {'row_index': 'even'}, 'backgroundColor': '#f9f9f9'}]
+
+# 엑셀 다운로드에 들어가는 컬럼과 한국어 헤더
+EXPORT_COLS = ['company_name', 'booth_location', 'pavilion', 'description', 'description_ko', 'website']
+EXPORT_RENAME = ['회사명', '부스 위치', '파빌리온', '영문 설명', '한글 설명', '웹페이지']
+
+# Pull the website URL out of a contact_details list in one pass. Only the
+# URL is kept on the frame; the raw list of contact dicts is discarded
+# after this instead of being retained per exhibitor.
+def _extract_website(contacts):
+    for contact in contacts:
+        if contact.get('type', '').lower() == 'website':
+            return contact.get('url', '')
+    return ''
+
+# Stream exhibitors from the JSON file into column lists (SoA) in one pass.
+# ijson parses incrementally, so the raw JSON tree is never fully
+# materialized, and no per-exhibitor dict is built either — scalar fields
+# are appended straight into columns and the derived fields are computed
+# vectorized on the finished frame.
+def load_dataframe():
+    columns = {
+        'company_name': [],
+        'booth_location': [],
+        'pavilion': [],
+        'categories': [],
+        'description': [],
+        'description_ko': [],
+        'social_media': [],
+        'website': [],
+    }
+    with open(SOURCE_JSON, 'rb') as f:
+        for exhibitor in ijson.items(f, 'item', use_float=True):
+            columns['company_name'].append(exhibitor.get('company_name', 'Unknown'))
+            columns['booth_location'].append(exhibitor.get('booth_location', 'Unknown'))
+            columns['pavilion'].append(exhibitor.get('pavilion', 'None'))
+            columns['categories'].append(exhibitor.get('categories', []))
+            columns['description'].append(exhibitor.get('description') or '')
+            columns['description_ko'].append(exhibitor.get('description_ko') or '')
+            columns['social_media'].append(exhibitor.get('social_media', []))
+            # 웹페이지 URL 추출
+            columns['website'].append(_extract_website(exhibitor.get('contact_details', [])))
+
+    df = pd.DataFrame(columns)
+
+    # Derived columns, computed over whole columns in pandas/NumPy
+    df['categories_count'] = df['categories'].str.len().astype('int32')
+    df['has_description'] = df['description_ko'].astype(bool).astype('int8')
+    df['social_media_count'] = df['social_media'].str.len().astype('int32')
+    # 테이블 렌더링 시 매번 자르지 않도록 200자 미리보기를 미리 만든다
+    df['description_preview'] = np.where(df['description'].str.len() > 200,
+                                         df['description'].str.slice(0, 200) + '...',
+                                         df['description'])
+    df['description_ko_preview'] = np.where(df['description_ko'].str.len() > 200,
+                                            df['description_ko'].str.slice(0, 200) + '...',
+                                            df['description_ko'])
+    return df
+
+# Build the two bar charts once; they come from static data, so there is
+# no reason to re-run px.bar and its figure validation on every app
+# construction (e.g. per gunicorn worker)
+def _build_category_figure(top_categories):
+    return px.bar(
+        top_categories,
+        x='count',
+        y='category',
+        orientation='h',
+        title='Top 30 Categories + Others',
+        labels={'count': 'Number of Exhibitors', 'category': 'Category'},
+        color='count',
+        color_continuous_scale='Viridis'
+    ).update_layout(
+        yaxis={'categoryorder': 'total ascending', 'categoryarray': ['Others'] + list(top_categories['category'][top_categories['category'] != 'Others'])},
+        height=840,  # Increase height by 1.4x (600 * 1.4 = 840)
+        xaxis={'range': [0, 150]},  # x축 최대값을 150으로 설정
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial, sans-serif", size=12, color="#2C3E50"),
+        title_font=dict(family="Arial, sans-serif", size=18, color="#2C3E50"),
+        margin=dict(l=20, r=20, t=50, b=20),
+        title_x=0.5
+    ).update_traces(
+        customdata=top_categories['category'],
+        hovertemplate='<b>%{customdata}</b><br>Count: %{x}<extra></extra>',
+        marker=dict(line=dict(width=0))
+    ).update_layout(
+        annotations=[
+            dict(
+                x=top_categories.loc[top_categories['category'] == 'Others', 'count'].values[0],
+                y='Others',
+                text="Actual count: 507",
+                showarrow=True,
+                arrowhead=1,
+                ax=0,
+                ay=-30,
+                font=dict(
+                    size=14,
+                    color="black"
+                ),
+                bgcolor="white",
+                bordercolor="black",
+                borderwidth=1,
+                borderpad=4
+            )
+        ]
+    )
+
+def _build_pavilion_figure(pavilion_counts):
+    return px.bar(
+        pavilion_counts,
+        x='count',
+        y='pavilion',
+        orientation='h',
+        title='Pavilions',
+        labels={'count': 'Number of Exhibitors', 'pavilion': 'Pavilion'},
+        color='count',
+        color_continuous_scale='Plasma'
+    ).update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        xaxis={'range': [0, 75]},  # x축 최대값을 75으로 설정
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial, sans-serif", size=12, color="#2C3E50"),
+        title_font=dict(family="Arial, sans-serif", size=18, color="#2C3E50"),
+        margin=dict(l=20, r=20, t=50, b=20),
+        title_x=0.5
+    ).update_traces(
+        marker=dict(line=dict(width=0))
+    )
 
 # Create visualizations
-def create_visualizations(processed_data):
-    # Convert to DataFrame for easier manipulation
-    df = pd.DataFrame(processed_data)
-    
-    # Flatten categories
-    all_categories = []
-    for categories in df['categories']:
-        all_categories.extend(categories)
-    
-    # Count categories
-    category_counts = Counter(all_categories)
-    
-    # Get top 30 categories
-    top_30_categories = dict(category_counts.most_common(30))
-    top_30_category_names = set(top_30_categories.keys())
-    
-    # Count companies that don't belong to any of the top 30 categories
-    others_count = 0
-    for exhibitor in df.to_dict('records'):
-        exhibitor_categories = set(exhibitor['categories'])
-        # If none of the exhibitor's categories are in top 30, count it
-        if not exhibitor_categories.intersection(top_30_category_names):
-            others_count += 1
-    
+def create_visualizations(df):
+    # Sort once globally; every index slice built below is then already
+    # alphabetical, so callbacks never sort per click
+    df = df.sort_values('company_name', kind='stable').reset_index(drop=True)
+
+    # pavilion은 소수의 값이 반복되는 저카디널리티 컬럼이라 category dtype으로
+    # 저장해 문자열 객체 중복을 없애고 groupby/value_counts 비용을 줄인다
+    df['pavilion'] = df['pavilion'].astype('category')
+
+    # Count categories with explode + value_counts; the hashing runs in
+    # pandas' C extension instead of a Python loop over every
+    # (exhibitor, category) pair
+    cat_series = df['categories'].explode().dropna()
+    # value_counts(sort=False) keeps categories in first-occurrence order;
+    # lexsort with that running order as tie-break then reproduces
+    # Counter.most_common(30) exactly, so ties at rank 30 resolve the same
+    # way they always did (and the Others bucket keeps its exact size)
+    category_counts = cat_series.value_counts(sort=False)
+    vals = category_counts.to_numpy()
+    k = min(30, len(vals))
+    top_idx = np.lexsort((np.arange(len(vals)), -vals))[:k]
+    top_30 = category_counts.iloc[top_idx]
+    top_30_category_names = set(top_30.index)
+
+    # Categories reordered so the top 30 come first
+    rest_idx = np.setdiff1d(np.arange(len(vals)), top_idx, assume_unique=True)
+    ordered_categories = category_counts.index[np.concatenate([top_idx, rest_idx])]
+
+    # Encode each category as a small int; codes follow ordered_categories,
+    # so "in the top 30" is simply code < 30. The inverted index
+    # (category -> row positions) and the Others complement then come out
+    # of a single argsort over the code array — no Python-level set math.
+    codes = pd.Categorical(cat_series, categories=ordered_categories).codes.astype(np.uint16)
+    rows = cat_series.index.to_numpy()
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    sorted_rows = rows[order]
+    boundaries = np.searchsorted(sorted_codes, np.arange(len(ordered_categories) + 1))
+    category_to_idx = {
+        category: sorted_rows[boundaries[code]:boundaries[code + 1]]
+        for code, category in enumerate(ordered_categories)
+    }
+
+    # Companies that don't belong to any of the top 30 categories: mark
+    # every row reached by a top-30 code, then take the complement
+    in_top = np.zeros(len(df), dtype=bool)
+    in_top[sorted_rows[sorted_codes < 30]] = True
+    others_idx = np.flatnonzero(~in_top)
+    others_count = len(others_idx)
+
     # Create DataFrame with top 30 categories and "Others"
     top_categories_data = {
-        'category': list(top_30_categories.keys()) + ['Others'],
-        'count': list(top_30_categories.values()) + [others_count]
+        'category': list(top_30.index) + ['Others'],
+        'count': list(top_30.values) + [others_count]
     }
     top_categories = pd.DataFrame(top_categories_data)
     
     # 데이터 수정: "Others" 카테고리의 표시 값을 "Artificial Intelligence"와 동일하게 설정
     # 실제 값은 별도로 저장
     real_others_count = others_count
-    if 'Artificial Intelligence' in top_30_categories:
-        ai_count = top_30_categories['Artificial Intelligence']
+    if 'Artificial Intelligence' in top_30.index:
+        ai_count = top_30['Artificial Intelligence']
         # "Others"의 표시 값을 "Artificial Intelligence"와 동일하게 설정
         top_categories.loc[top_categories['category'] == 'Others', 'count'] = ai_count
     
     # 실제 "Others" 값을 저장 (고정값 507로 설정)
     others_real_count = 507
     
+    # Overview card counters, computed once at C level instead of with
+    # Python generator expressions inside the layout
+    unique_category_count = cat_series.nunique()
+    unique_pavilion_count = df.loc[df['pavilion'] != 'None', 'pavilion'].nunique()
+
     # Create pavilion distribution
     pavilion_counts = df['pavilion'].value_counts().reset_index()
     pavilion_counts.columns = ['pavilion', 'count']
@@ -109,21 +301,35 @@ def create_visualizations(processed_data):
     social_media_dist.columns = ['social_media_count', 'count']
     social_media_dist = social_media_dist.sort_values('social_media_count')
     
+    # 다운로드용 표준 프레임: 내보내기 컬럼만 잘라 한국어 헤더로 바꾸고
+    # 회사명으로 인덱싱해 두면 다운로드는 선택된 회사들의 해시 조회가 된다
+    export_df = df[EXPORT_COLS].set_axis(EXPORT_RENAME, axis=1).set_index('회사명', drop=False)
+
     return {
         'df': df,
+        'export_df': export_df,
         'top_categories': top_categories,
+        'category_fig': _build_category_figure(top_categories),
+        'pavilion_fig': _build_pavilion_figure(pavilion_counts),
         'top_30_category_names': top_30_category_names,
+        'category_to_idx': category_to_idx,
+        'others_idx': others_idx,
+        # observed=False explicitly: silences the pandas 2.1 FutureWarning
+        # for categorical groupby; every pavilion category is observed, so
+        # either value gives the same indices
+        'pavilion_to_idx': df.groupby('pavilion', observed=False).indices,
+        'unique_category_count': unique_category_count,
+        'unique_pavilion_count': unique_pavilion_count,
         'pavilion_counts': pavilion_counts,
         'description_counts': description_counts,
         'social_media_dist': social_media_dist,
         'others_real_count': others_real_count  # 실제 "Others" 값 추가
     }
 
-# Create Dash app
-def create_app(viz_data):
-    app = Dash(__name__, title='HIMSS 2025 Exhibitor Analysis', suppress_callback_exceptions=True)
-    
-    app.layout = html.Div([
+
+# Static layout, built once per process from precomputed viz_data
+def _build_layout(viz_data):
+    return html.Div([
         # 언어 상태를 저장할 dcc.Store 컴포넌트 추가
         dcc.Store(id='language-store', data={'language': 'ko'}),  # 기본값은 한글(ko)
         
@@ -137,11 +343,11 @@ def create_app(viz_data):
                     html.Div("Total Exhibitors", style={'fontSize': '16px', 'textAlign': 'center', 'color': 'white', 'marginTop': '5px'})
                 ], style={'width': '30%', 'display': 'inline-block', 'padding': '20px', 'backgroundColor': '#4CAF50', 'borderRadius': '8px', 'boxShadow': '0 4px 8px rgba(0,0,0,0.2)', 'margin': '0 1.5%'}),
                 html.Div([
-                    html.Div(f"{len(set(cat for cats in viz_data['df']['categories'] for cat in cats))}", style={'fontSize': '32px', 'fontWeight': 'bold', 'textAlign': 'center', 'color': 'white'}),
+                    html.Div(f"{viz_data['unique_category_count']}", style={'fontSize': '32px', 'fontWeight': 'bold', 'textAlign': 'center', 'color': 'white'}),
                     html.Div("Unique Categories", style={'fontSize': '16px', 'textAlign': 'center', 'color': 'white', 'marginTop': '5px'})
                 ], style={'width': '30%', 'display': 'inline-block', 'padding': '20px', 'backgroundColor': '#3498DB', 'borderRadius': '8px', 'boxShadow': '0 4px 8px rgba(0,0,0,0.2)', 'margin': '0 1.5%'}),
                 html.Div([
-                    html.Div(f"{viz_data['df']['pavilion'].nunique() - (1 if 'None' in viz_data['df']['pavilion'].unique() else 0)}", style={'fontSize': '32px', 'fontWeight': 'bold', 'textAlign': 'center', 'color': 'white'}),
+                    html.Div(f"{viz_data['unique_pavilion_count']}", style={'fontSize': '32px', 'fontWeight': 'bold', 'textAlign': 'center', 'color': 'white'}),
                     html.Div("Unique Pavilions", style={'fontSize': '16px', 'textAlign': 'center', 'color': 'white', 'marginTop': '5px'})
                 ], style={'width': '30%', 'display': 'inline-block', 'padding': '20px', 'backgroundColor': '#E74C3C', 'borderRadius': '8px', 'boxShadow': '0 4px 8px rgba(0,0,0,0.2)', 'margin': '0 1.5%'}),
             ], style={'textAlign': 'center', 'whiteSpace': 'nowrap', 'display': 'flex', 'justifyContent': 'space-between', 'alignItems': 'center'}),
@@ -150,55 +356,16 @@ def create_app(viz_data):
             html.H2('Top 30 Categories + Others', style={'textAlign': 'center', 'color': '#2C3E50', 'fontFamily': 'Arial, sans-serif', 'marginBottom': '20px'}),
             dcc.Graph(
                 id='category-chart',
-                figure=px.bar(
-                    viz_data['top_categories'], 
-                    x='count', 
-                    y='category',
-                    orientation='h',
-                    title='Top 30 Categories + Others',
-                    labels={'count': 'Number of Exhibitors', 'category': 'Category'},
-                    color='count',
-                    color_continuous_scale='Viridis'
-                ).update_layout(
-                    yaxis={'categoryorder': 'total ascending', 'categoryarray': ['Others'] + list(viz_data['top_categories']['category'][viz_data['top_categories']['category'] != 'Others'])},
-                    height=840,  # Increase height by 1.4x (600 * 1.4 = 840)
-                    xaxis={'range': [0, 150]},  # x축 최대값을 150으로 설정
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(family="Arial, sans-serif", size=12, color="#2C3E50"),
-                    title_font=dict(family="Arial, sans-serif", size=18, color="#2C3E50"),
-                    margin=dict(l=20, r=20, t=50, b=20),
-                    title_x=0.5
-                ).update_traces(
-                    customdata=viz_data['top_categories']['category'],
-                    hovertemplate='<b>%{customdata}</b><br>Count: %{x}<extra></extra>',
-                    marker=dict(line=dict(width=0))
-                ).update_layout(
-                    annotations=[
-                        dict(
-                            x=viz_data['top_categories'].loc[viz_data['top_categories']['category'] == 'Others', 'count'].values[0],
-                            y='Others',
-                            text="Actual count: 507",
-                            showarrow=True,
-                            arrowhead=1,
-                            ax=0,
-                            ay=-30,
-                            font=dict(
-                                size=14,
-                                color="black"
-                            ),
-                            bgcolor="white",
-                            bordercolor="black",
-                            borderwidth=1,
-                            borderpad=4
-                        )
-                    ]
-                ),
+                figure=viz_data['category_fig'],
                 config={'displayModeBar': False}
             ),
             html.Div([
                 html.Div(id='category-click-output'),
-                html.Button('Download Selected', id='download-category-btn', style={'marginTop': '20px', 'padding': '12px 20px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer', 'display': 'none', 'fontWeight': 'bold', 'boxShadow': '0 2px 5px rgba(0,0,0,0.2)', 'transition': 'background-color 0.3s'}),
+                html.Div([
+                    html.Button('Download CSV', id='download-category-csv-btn', style=DOWNLOAD_BTN_STYLE),
+                    html.Button('Download Excel', id='download-category-btn', style=DOWNLOAD_BTN_STYLE),
+                ], id='download-category-btns', style=DOWNLOAD_BTN_HIDDEN_STYLE),
+                dcc.Download(id='download-category-csv'),
                 dcc.Download(id='download-category-data')
             ])
         ], style={'marginBottom': 40, 'backgroundColor': '#f9f9f9', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 4px 8px 0 rgba(0,0,0,0.1)'}),
@@ -207,32 +374,16 @@ def create_app(viz_data):
             html.H2('Pavilions', style={'textAlign': 'center', 'color': '#2C3E50', 'fontFamily': 'Arial, sans-serif', 'marginBottom': '20px'}),
             dcc.Graph(
                 id='pavilion-chart',
-                figure=px.bar(
-                    viz_data['pavilion_counts'], 
-                    x='count', 
-                    y='pavilion',
-                    orientation='h',
-                    title='Pavilions',
-                    labels={'count': 'Number of Exhibitors', 'pavilion': 'Pavilion'},
-                    color='count',
-                    color_continuous_scale='Plasma'
-                ).update_layout(
-                    yaxis={'categoryorder': 'total ascending'},
-                    xaxis={'range': [0, 75]},  # x축 최대값을 75으로 설정
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(family="Arial, sans-serif", size=12, color="#2C3E50"),
-                    title_font=dict(family="Arial, sans-serif", size=18, color="#2C3E50"),
-                    margin=dict(l=20, r=20, t=50, b=20),
-                    title_x=0.5
-                ).update_traces(
-                    marker=dict(line=dict(width=0))
-                ),
+                figure=viz_data['pavilion_fig'],
                 config={'displayModeBar': False}
             ),
             html.Div([
                 html.Div(id='pavilion-click-output'),
-                html.Button('Download Selected', id='download-pavilion-btn', style={'marginTop': '20px', 'padding': '12px 20px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer', 'display': 'none', 'fontWeight': 'bold', 'boxShadow': '0 2px 5px rgba(0,0,0,0.2)', 'transition': 'background-color 0.3s'}),
+                html.Div([
+                    html.Button('Download CSV', id='download-pavilion-csv-btn', style=DOWNLOAD_BTN_STYLE),
+                    html.Button('Download Excel', id='download-pavilion-btn', style=DOWNLOAD_BTN_STYLE),
+                ], id='download-pavilion-btns', style=DOWNLOAD_BTN_HIDDEN_STYLE),
+                dcc.Download(id='download-pavilion-csv'),
                 dcc.Download(id='download-pavilion-data')
             ])
         ], style={'marginBottom': 40, 'backgroundColor': '#f9f9f9', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 4px 8px 0 rgba(0,0,0,0.1)'}),
@@ -242,11 +393,111 @@ def create_app(viz_data):
                    style={'textAlign': 'center', 'marginTop': 50, 'padding': '20px', 'backgroundColor': '#2C3E50', 'color': 'white', 'borderRadius': '5px', 'fontFamily': 'Arial, sans-serif'})
         ])
     ], style={'margin': '0 auto', 'maxWidth': '1200px', 'padding': '20px', 'fontFamily': 'Arial, sans-serif', 'backgroundColor': '#ffffff'})
-    
-    # Store for selected exhibitors
-    app.selected_category_exhibitors = {}
-    app.selected_pavilion_exhibitors = {}
-    
+
+# Dash callbacks, closed over the precomputed viz_data
+def _register_callbacks(app, viz_data):
+    # 선택된 회사들을 표준 내보내기 프레임에서 한 번에 골라 엑셀로 만든다.
+    # xlsxwriter의 constant_memory 모드는 행을 쓰는 즉시 버퍼로 흘려보내므로
+    # openpyxl처럼 워크북 전체를 파이썬 객체로 쌓아 두지 않는다. 같은 선택으로
+    # 다운로드를 반복하면(더블클릭, 새로고침) 캐시된 바이트를 그대로 보낸다.
+    @lru_cache(maxsize=32)
+    def _xlsx_bytes(names):
+        export = viz_data['export_df'].loc[sorted(names)]
+        buf = io.BytesIO()
+        # strings_to_urls=False: 웹페이지 컬럼의 URL마다 하이퍼링크 객체를
+        # 만들지 않는다 (65530개 제한도 함께 피한다)
+        # 주의: constant_memory는 쓰면 안 된다 — to_excel이 컬럼 단위로
+        # 셀을 쓰는데 constant_memory 모드는 이미 플러시된 행 재방문을
+        # 조용히 버려서 첫 컬럼만 남는다
+        with pd.ExcelWriter(buf, engine='xlsxwriter',
+                            engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+            export.to_excel(writer, sheet_name="Selected Companies", index=False,
+                            freeze_panes=(1, 0))
+        return buf.getvalue()
+
+    @lru_cache(maxsize=32)
+    def _csv_bytes(names):
+        export = viz_data['export_df'].loc[sorted(names)]
+        # BOM(utf-8-sig)을 붙여야 Excel이 한글 컬럼을 깨지지 않게 연다
+        return export.to_csv(index=False).encode('utf-8-sig')
+
+    def _build_download(selected_companies):
+        data = _xlsx_bytes(frozenset(selected_companies))
+        return dcc.send_bytes(lambda buf: buf.write(data), "selected_companies.xlsx")
+
+    def _build_csv_download(selected_companies):
+        data = _csv_bytes(frozenset(selected_companies))
+        return dcc.send_bytes(lambda buf: buf.write(data), "selected_companies.csv")
+
+    @lru_cache(maxsize=64)
+    def get_exhibitors_df(selection, kind):
+        # Resolve a clicked bar to its exhibitor slice through the prebuilt
+        # indexes; cached so repeat clicks and language toggles reuse the
+        # same frame. The frame is globally sorted by company_name, so the
+        # slices come out alphabetical without a per-click sort.
+        # selection은 클라이언트가 보낸 clickData에서 그대로 오므로,
+        # 인덱스에 없는 값은 Others 슬라이스가 아니라 빈 슬라이스로
+        # 처리하고('Others' 막대만 예외) 캐시도 _render_table처럼 64개로
+        # 묶어 임의의 키 폭주로 메모리가 자라지 않게 한다
+        if kind == 'category':
+            if selection == 'Others':
+                idxs = viz_data['others_idx']
+            else:
+                idxs = viz_data['category_to_idx'].get(selection, [])
+        else:
+            idxs = viz_data['pavilion_to_idx'].get(selection, [])
+        return viz_data['df'].iloc[idxs].reset_index(drop=True)
+
+    @lru_cache(maxsize=64)
+    def _filtered_exhibitors(selection, kind):
+        return tuple(get_exhibitors_df(selection, kind).itertuples(index=False))
+
+    @lru_cache(maxsize=64)
+    def _render_table(selection, kind, language):
+        # Build the exhibitor table for one (selection, language) pair.
+        # Cached so re-clicking the same bar or toggling language back
+        # returns the already-built component tree without reallocating it;
+        # the LRU bound keeps the retained trees to at most 64 entries.
+        filtered_exhibitors = _filtered_exhibitors(selection, kind)
+
+        # 언어에 따라 설명 필드 선택
+        description_field = 'description_ko_preview' if language == 'ko' else 'description_preview'
+
+        # 언어 토글 버튼 스타일 설정
+        ko_style = KO_ACTIVE_STYLE if language == 'ko' else KO_INACTIVE_STYLE
+        en_style = EN_ACTIVE_STYLE if language == 'en' else EN_INACTIVE_STYLE
+
+        # Create table with header and row selection
+        return html.Div([
+            html.H3(f'Companies in {kind}: {selection} ({len(filtered_exhibitors)} exhibitors)',
+                   style={'textAlign': 'left', 'color': '#2C3E50', 'fontFamily': 'Arial, sans-serif', 'marginBottom': '15px', 'fontWeight': 'bold', 'borderBottom': '2px solid #4CAF50', 'paddingBottom': '10px'}),
+            # 언어 토글 버튼 추가
+            html.Div([
+                html.Button('한글', id=f'ko-button-{kind}', n_clicks=0, style=ko_style),
+                html.Button('English', id=f'en-button-{kind}', n_clicks=0, style=en_style)
+            ], style={'marginBottom': '20px', 'textAlign': 'right', 'padding': '10px 0'}),
+            # DataTable은 행별 Tr/Td 컴포넌트 대신 컬럼 단위 payload로 직렬화되고,
+            # 행 선택 체크박스도 selected_rows 하나로 모인다
+            dash_table.DataTable(
+                id=f'{kind}-table',
+                data=[{
+                    'company_name': exhibitor.company_name,
+                    'booth_location': exhibitor.booth_location,
+                    'description': getattr(exhibitor, description_field),
+                    'website': f'[Website]({exhibitor.website})' if exhibitor.website else '',
+                } for exhibitor in filtered_exhibitors],
+                columns=TABLE_COLUMNS,
+                row_selectable='multi',
+                page_size=50,
+                markdown_options={'link_target': '_blank'},
+                style_table={'width': '100%', 'boxShadow': '0 4px 8px 0 rgba(0,0,0,0.2)', 'borderRadius': '5px', 'overflow': 'hidden', 'marginTop': '20px'},
+                style_header=TABLE_STYLE_HEADER,
+                style_cell=TABLE_STYLE_CELL,
+                style_cell_conditional=TABLE_STYLE_CELL_CONDITIONAL,
+                style_data_conditional=TABLE_STYLE_DATA_CONDITIONAL,
+            )
+        ])
+
     # 카테고리 섹션 언어 토글 버튼 콜백
     @callback(
         Output('language-store', 'data'),
@@ -259,350 +510,113 @@ def create_app(viz_data):
     )
     def toggle_language_category(ko_clicks, en_clicks, language_data):
         # 어떤 버튼이 클릭되었는지 확인
-        triggered_id = ctx.triggered_id
-        
-        # 한글 버튼 스타일
-        ko_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50', 
-            'color': 'white', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 영어 버튼 스타일
-        en_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#ccc', 
-            'color': 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 비활성화된 한글 버튼 스타일
-        ko_inactive_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#ccc', 
-            'color': 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 비활성화된 영어 버튼 스타일
-        en_inactive_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50', 
-            'color': 'white', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        if triggered_id == 'ko-button-category':
-            return {'language': 'ko'}, ko_style, ko_inactive_style
-        else:  # en-button-category
-            return {'language': 'en'}, en_inactive_style, en_style
+        if ctx.triggered[0]['prop_id'].startswith('ko-'):
+            return {'language': 'ko'}, KO_ACTIVE_STYLE, EN_INACTIVE_STYLE
+        # en-button-category
+        return {'language': 'en'}, KO_INACTIVE_STYLE, EN_ACTIVE_STYLE
     
     @callback(
         Output('category-click-output', 'children'),
-        Output('download-category-btn', 'style'),
+        Output('download-category-btns', 'style'),
         Input('category-chart', 'clickData'),
         Input('language-store', 'data'),
         prevent_initial_call=False
     )
     def display_category_click_data(clickData, language_data):
-        # 어떤 입력이 콜백을 트리거했는지 확인
-        triggered_id = ctx.triggered_id
-        
         if not clickData:
-            return html.P('Click on a category bar to see exhibitors in that category'), {'display': 'none'}
-        
+            return html.P('Click on a category bar to see exhibitors in that category'), DOWNLOAD_BTN_HIDDEN_STYLE
+
         # 현재 선택된 언어 가져오기
         current_language = language_data.get('language', 'ko')
-        
+
         # Get the clicked category
         selected_category = clickData['points'][0]['y']
-        
-        # Special handling for "Others" category
-        if selected_category == 'Others':
-            # Get the top 30 categories
-            top_30_categories = viz_data['top_30_category_names']
-            
-            # Filter exhibitors that don't belong to any of the top 30 categories
-            filtered_exhibitors = []
-            for exhibitor in viz_data['df'].to_dict('records'):
-                exhibitor_categories = set(exhibitor['categories'])
-                # If none of the exhibitor's categories are in top 30, include it
-                if not exhibitor_categories.intersection(top_30_categories):
-                    filtered_exhibitors.append(exhibitor)
-        else:
-            # Regular category filtering
-            filtered_exhibitors = [
-                exhibitor for exhibitor in viz_data['df'].to_dict('records')
-                if selected_category in exhibitor['categories']
-            ]
-        
-        # Sort by company name
-        filtered_exhibitors = sorted(filtered_exhibitors, key=lambda x: x['company_name'])
-        
-        # Store filtered exhibitors for download
-        app.selected_category_exhibitors = {exhibitor['company_name']: exhibitor for exhibitor in filtered_exhibitors}
-        
-        # 언어에 따라 설명 필드 선택
-        description_field = 'description_ko' if current_language == 'ko' else 'description'
-        
-        # 언어 토글 버튼 스타일 설정
-        ko_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50' if current_language == 'ko' else '#ccc', 
-            'color': 'white' if current_language == 'ko' else 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)' if current_language == 'ko' else '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        en_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50' if current_language == 'en' else '#ccc', 
-            'color': 'white' if current_language == 'en' else 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)' if current_language == 'en' else '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # Create table with header and checkboxes
-        return html.Div([
-            html.H3(f'Companies in category: {selected_category} ({len(filtered_exhibitors)} exhibitors)', 
-                   style={'textAlign': 'left', 'color': '#2C3E50', 'fontFamily': 'Arial, sans-serif', 'marginBottom': '15px', 'fontWeight': 'bold', 'borderBottom': '2px solid #4CAF50', 'paddingBottom': '10px'}),
-            # 언어 토글 버튼 추가
-            html.Div([
-                html.Button('한글', id='ko-button-category', n_clicks=0, style=ko_style),
-                html.Button('English', id='en-button-category', n_clicks=0, style=en_style)
-            ], style={'marginBottom': '20px', 'textAlign': 'right', 'padding': '10px 0'}),
-            html.Table(
-                [html.Tr([
-                    html.Th('Select', style={'width': '5%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}),
-                    html.Th('Company Name', style={'width': '15%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'left', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}), 
-                    html.Th('Booth Location', style={'width': '10%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}),
-                    html.Th('Description', style={'width': '60%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'left', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}), 
-                    html.Th('Homepage', style={'width': '10%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'})
-                ], style={'backgroundColor': '#f2f2f2'})] +
-                [html.Tr([
-                    html.Td(dcc.Checklist(
-                        id={'type': 'category-checkbox', 'index': exhibitor['company_name']},
-                        options=[{'label': '', 'value': exhibitor['company_name']}],
-                        value=[],
-                        style={'margin': '0', 'padding': '0'}
-                    ), style={'width': '5%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'}),
-                    html.Td(exhibitor['company_name'], style={'width': '15%', 'padding': '10px', 'textAlign': 'left', 'borderBottom': '1px solid #ddd', 'fontWeight': 'bold'}),
-                    html.Td(exhibitor['booth_location'], style={'width': '10%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'}),
-                    html.Td(exhibitor[description_field][:200] + '...' if exhibitor[description_field] and len(exhibitor[description_field]) > 200 else exhibitor[description_field], style={'width': '60%', 'padding': '10px', 'textAlign': 'left', 'borderBottom': '1px solid #ddd', 'lineHeight': '1.5'}),
-                    html.Td(html.A('Website', href=next((contact['url'] for contact in exhibitor.get('contact_details', []) if contact.get('type', '').lower() == 'website'), '#'), target='_blank', style={'textDecoration': 'none', 'color': '#4CAF50', 'fontWeight': 'bold'}) if any(contact.get('type', '').lower() == 'website' for contact in exhibitor.get('contact_details', [])) else '', style={'width': '10%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'})
-                ], style={'backgroundColor': i % 2 == 0 and '#f9f9f9' or 'white'}) for i, exhibitor in enumerate(filtered_exhibitors)],
-                style={'width': '100%', 'borderCollapse': 'collapse', 'boxShadow': '0 4px 8px 0 rgba(0,0,0,0.2)', 'borderRadius': '5px', 'overflow': 'hidden', 'marginTop': '20px', 'fontFamily': 'Arial, sans-serif'}
-            )
-        ]), {'marginTop': '20px', 'padding': '12px 20px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer', 'display': 'block', 'fontWeight': 'bold', 'boxShadow': '0 2px 5px rgba(0,0,0,0.2)', 'transition': 'background-color 0.3s'}
+
+        return _render_table(selected_category, 'category', current_language), DOWNLOAD_BTN_VISIBLE_STYLE
     
     @callback(
         Output('pavilion-click-output', 'children'),
-        Output('download-pavilion-btn', 'style'),
+        Output('download-pavilion-btns', 'style'),
         Input('pavilion-chart', 'clickData'),
         Input('language-store', 'data'),
         prevent_initial_call=False
     )
     def display_pavilion_click_data(clickData, language_data):
-        # 어떤 입력이 콜백을 트리거했는지 확인
-        triggered_id = ctx.triggered_id
-        
         if not clickData:
-            return html.P('Click on a pavilion bar to see exhibitors in that pavilion'), {'display': 'none'}
-        
+            return html.P('Click on a pavilion bar to see exhibitors in that pavilion'), DOWNLOAD_BTN_HIDDEN_STYLE
+
         # 현재 선택된 언어 가져오기
         current_language = language_data.get('language', 'ko')
-        
+
         # Get the clicked pavilion
         selected_pavilion = clickData['points'][0]['y']
-        
-        # Filter exhibitors by selected pavilion
-        filtered_exhibitors = [
-            exhibitor for exhibitor in viz_data['df'].to_dict('records')
-            if exhibitor['pavilion'] == selected_pavilion
-        ]
-        
-        # Sort by company name
-        filtered_exhibitors = sorted(filtered_exhibitors, key=lambda x: x['company_name'])
-        
-        # Store filtered exhibitors for download
-        app.selected_pavilion_exhibitors = {exhibitor['company_name']: exhibitor for exhibitor in filtered_exhibitors}
-        
-        # 언어에 따라 설명 필드 선택
-        description_field = 'description_ko' if current_language == 'ko' else 'description'
-        
-        # 언어 토글 버튼 스타일 설정
-        ko_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50' if current_language == 'ko' else '#ccc', 
-            'color': 'white' if current_language == 'ko' else 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)' if current_language == 'ko' else '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        en_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50' if current_language == 'en' else '#ccc', 
-            'color': 'white' if current_language == 'en' else 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)' if current_language == 'en' else '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # Create table with header and checkboxes
-        return html.Div([
-            html.H3(f'Companies in pavilion: {selected_pavilion} ({len(filtered_exhibitors)} exhibitors)', 
-                   style={'textAlign': 'left', 'color': '#2C3E50', 'fontFamily': 'Arial, sans-serif', 'marginBottom': '15px', 'fontWeight': 'bold', 'borderBottom': '2px solid #4CAF50', 'paddingBottom': '10px'}),
-            # 언어 토글 버튼 추가 (카테고리와 다른 ID 사용)
-            html.Div([
-                html.Button('한글', id='ko-button-pavilion', n_clicks=0, style=ko_style),
-                html.Button('English', id='en-button-pavilion', n_clicks=0, style=en_style)
-            ], style={'marginBottom': '20px', 'textAlign': 'right', 'padding': '10px 0'}),
-            html.Table(
-                [html.Tr([
-                    html.Th('Select', style={'width': '5%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}),
-                    html.Th('Company Name', style={'width': '15%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'left', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}), 
-                    html.Th('Booth Location', style={'width': '10%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}),
-                    html.Th('Description', style={'width': '60%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'left', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'}), 
-                    html.Th('Homepage', style={'width': '10%', 'padding': '12px', 'backgroundColor': '#4CAF50', 'color': 'white', 'textAlign': 'center', 'fontWeight': 'bold', 'borderBottom': '2px solid #ddd'})
-                ], style={'backgroundColor': '#f2f2f2'})] +
-                [html.Tr([
-                    html.Td(dcc.Checklist(
-                        id={'type': 'pavilion-checkbox', 'index': exhibitor['company_name']},
-                        options=[{'label': '', 'value': exhibitor['company_name']}],
-                        value=[],
-                        style={'margin': '0', 'padding': '0'}
-                    ), style={'width': '5%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'}),
-                    html.Td(exhibitor['company_name'], style={'width': '15%', 'padding': '10px', 'textAlign': 'left', 'borderBottom': '1px solid #ddd', 'fontWeight': 'bold'}),
-                    html.Td(exhibitor['booth_location'], style={'width': '10%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'}),
-                    html.Td(exhibitor[description_field][:200] + '...' if exhibitor[description_field] and len(exhibitor[description_field]) > 200 else exhibitor[description_field], style={'width': '60%', 'padding': '10px', 'textAlign': 'left', 'borderBottom': '1px solid #ddd', 'lineHeight': '1.5'}),
-                    html.Td(html.A('Website', href=next((contact['url'] for contact in exhibitor.get('contact_details', []) if contact.get('type', '').lower() == 'website'), '#'), target='_blank', style={'textDecoration': 'none', 'color': '#4CAF50', 'fontWeight': 'bold'}) if any(contact.get('type', '').lower() == 'website' for contact in exhibitor.get('contact_details', [])) else '', style={'width': '10%', 'padding': '10px', 'textAlign': 'center', 'borderBottom': '1px solid #ddd'})
-                ], style={'backgroundColor': i % 2 == 0 and '#f9f9f9' or 'white'}) for i, exhibitor in enumerate(filtered_exhibitors)],
-                style={'width': '100%', 'borderCollapse': 'collapse', 'boxShadow': '0 4px 8px 0 rgba(0,0,0,0.2)', 'borderRadius': '5px', 'overflow': 'hidden', 'marginTop': '20px', 'fontFamily': 'Arial, sans-serif'}
-            )
-        ]), {'marginTop': '20px', 'padding': '12px 20px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer', 'display': 'block', 'fontWeight': 'bold', 'boxShadow': '0 2px 5px rgba(0,0,0,0.2)', 'transition': 'background-color 0.3s'}
+
+        return _render_table(selected_pavilion, 'pavilion', current_language), DOWNLOAD_BTN_VISIBLE_STYLE
     
     @callback(
         Output('download-category-data', 'data'),
         Input('download-category-btn', 'n_clicks'),
-        State({'type': 'category-checkbox', 'index': ALL}, 'value'),
-        State({'type': 'category-checkbox', 'index': ALL}, 'id'),
+        State('category-table', 'selected_rows'),
+        State('category-table', 'data'),
         prevent_initial_call=True
     )
-    def download_selected_category_data(n_clicks, checkbox_values, checkbox_ids):
-        if not n_clicks:
+    def download_selected_category_data(n_clicks, selected_rows, table_data):
+        if not n_clicks or not selected_rows:
             return None
-        
+
         # Get selected company names
-        selected_companies = []
-        for i, values in enumerate(checkbox_values):
-            if values:  # If checklist has any values selected
-                selected_companies.append(values[0])  # Get the first (and only) value
-        
-        if not selected_companies:
-            return None
-        
-        # Create DataFrame with selected companies
-        selected_data = []
-        for company_name in selected_companies:
-            if company_name in app.selected_category_exhibitors:
-                selected_data.append(app.selected_category_exhibitors[company_name])
-        
-        if not selected_data:
+        selected_companies = [table_data[i]['company_name'] for i in selected_rows]
+
+        return _build_download(selected_companies)
+
+    @callback(
+        Output('download-category-csv', 'data'),
+        Input('download-category-csv-btn', 'n_clicks'),
+        State('category-table', 'selected_rows'),
+        State('category-table', 'data'),
+        prevent_initial_call=True
+    )
+    def download_selected_category_csv(n_clicks, selected_rows, table_data):
+        if not n_clicks or not selected_rows:
             return None
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(selected_data)
-        
-        # 필요한 필드만 선택
-        if not df.empty:
-            df = df[['company_name', 'booth_location', 'pavilion', 'description', 'description_ko', 'website']]
-            # 컬럼명 변경
-            df.columns = ['회사명', '부스 위치', '파빌리온', '영문 설명', '한글 설명', '웹페이지']
-        
-        # Return Excel file
-        return dcc.send_data_frame(df.to_excel, "selected_companies.xlsx", sheet_name="Selected Companies")
-    
+
+        # Get selected company names
+        selected_companies = [table_data[i]['company_name'] for i in selected_rows]
+
+        return _build_csv_download(selected_companies)
+
     @callback(
         Output('download-pavilion-data', 'data'),
         Input('download-pavilion-btn', 'n_clicks'),
-        State({'type': 'pavilion-checkbox', 'index': ALL}, 'value'),
-        State({'type': 'pavilion-checkbox', 'index': ALL}, 'id'),
+        State('pavilion-table', 'selected_rows'),
+        State('pavilion-table', 'data'),
         prevent_initial_call=True
     )
-    def download_selected_pavilion_data(n_clicks, checkbox_values, checkbox_ids):
-        if not n_clicks:
+    def download_selected_pavilion_data(n_clicks, selected_rows, table_data):
+        if not n_clicks or not selected_rows:
             return None
-        
+
         # Get selected company names
-        selected_companies = []
-        for i, values in enumerate(checkbox_values):
-            if values:  # If checklist has any values selected
-                selected_companies.append(values[0])  # Get the first (and only) value
-        
-        if not selected_companies:
-            return None
-        
-        # Create DataFrame with selected companies
-        selected_data = []
-        for company_name in selected_companies:
-            if company_name in app.selected_pavilion_exhibitors:
-                selected_data.append(app.selected_pavilion_exhibitors[company_name])
-        
-        if not selected_data:
+        selected_companies = [table_data[i]['company_name'] for i in selected_rows]
+
+        return _build_download(selected_companies)
+
+    @callback(
+        Output('download-pavilion-csv', 'data'),
+        Input('download-pavilion-csv-btn', 'n_clicks'),
+        State('pavilion-table', 'selected_rows'),
+        State('pavilion-table', 'data'),
+        prevent_initial_call=True
+    )
+    def download_selected_pavilion_csv(n_clicks, selected_rows, table_data):
+        if not n_clicks or not selected_rows:
             return None
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(selected_data)
-        
-        # 필요한 필드만 선택
-        if not df.empty:
-            df = df[['company_name', 'booth_location', 'pavilion', 'description', 'description_ko', 'website']]
-            # 컬럼명 변경
-            df.columns = ['회사명', '부스 위치', '파빌리온', '영문 설명', '한글 설명', '웹페이지']
-        
-        # Return Excel file
-        return dcc.send_data_frame(df.to_excel, "selected_companies.xlsx", sheet_name="Selected Companies")
-    
+
+        # Get selected company names
+        selected_companies = [table_data[i]['company_name'] for i in selected_rows]
+
+        return _build_csv_download(selected_companies)
+
     @callback(
         Output('language-store', 'data', allow_duplicate=True),
         Output('ko-button-pavilion', 'style'),
@@ -614,90 +628,65 @@ def create_app(viz_data):
     )
     def toggle_language_pavilion(ko_clicks, en_clicks, language_data):
         # 어떤 버튼이 클릭되었는지 확인
-        triggered_id = ctx.triggered_id
-        
-        # 한글 버튼 스타일
-        ko_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50', 
-            'color': 'white', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 영어 버튼 스타일
-        en_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#ccc', 
-            'color': 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 비활성화된 한글 버튼 스타일
-        ko_inactive_style = {
-            'marginRight': '10px', 
-            'padding': '8px 15px', 
-            'backgroundColor': '#ccc', 
-            'color': 'black', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.1)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # 비활성화된 영어 버튼 스타일
-        en_inactive_style = {
-            'padding': '8px 15px', 
-            'backgroundColor': '#4CAF50', 
-            'color': 'white', 
-            'border': 'none', 
-            'borderRadius': '5px', 
-            'cursor': 'pointer',
-            'fontWeight': 'bold',
-            'boxShadow': '0 2px 5px rgba(0,0,0,0.2)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        if triggered_id == 'ko-button-pavilion':
-            return {'language': 'ko'}, ko_style, ko_inactive_style
-        else:  # en-button-pavilion
-            return {'language': 'en'}, en_inactive_style, en_style
-    
+        if ctx.triggered[0]['prop_id'].startswith('ko-'):
+            return {'language': 'ko'}, KO_ACTIVE_STYLE, EN_INACTIVE_STYLE
+        # en-button-pavilion
+        return {'language': 'en'}, KO_INACTIVE_STYLE, EN_ACTIVE_STYLE
+
+    # 클릭 가능한 막대는 차트에 그려진 것들뿐이므로(상위 30개 카테고리 +
+    # Others + 파빌리온 15개), 그 슬라이스들을 기동 시 미리 잘라 두면
+    # 첫 클릭도 캐시 적중이 된다
+    for selection in viz_data['top_categories']['category']:
+        _filtered_exhibitors(selection, 'category')
+    for selection in viz_data['pavilion_counts']['pavilion']:
+        _filtered_exhibitors(selection, 'pavilion')
+
+
+# Create Dash app
+def create_app(viz_data):
+    app = Dash(__name__, title='HIMSS 2025 Exhibitor Analysis', suppress_callback_exceptions=True)
+
+    app.server.json = ORJSONProvider(app.server)
+
+    # 콜백 응답(특히 큰 테이블 JSON)을 gzip으로 압축해 전송량을 줄인다
+    app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+    app.server.config['COMPRESS_LEVEL'] = 6
+    Compress(app.server)
+
+    app.layout = _build_layout(viz_data)
+    _register_callbacks(app, viz_data)
+
     return app
 
+def _load_viz_data():
+    # 가공이 끝난 viz_data를 피클로 캐시해 두고, 원본 JSON이 그대로면
+    # 재기동 시 파싱/집계를 통째로 건너뛴다
+    source_mtime = os.path.getmtime(SOURCE_JSON)
+    if os.path.exists(VIZ_CACHE):
+        try:
+            with open(VIZ_CACHE, 'rb') as f:
+                cached_mtime, viz_data = pickle.load(f)
+            if cached_mtime == source_mtime:
+                return viz_data
+        except Exception:
+            pass  # 손상되거나 버전이 다른 캐시는 무시하고 다시 계산
+
+    viz_data = create_visualizations(load_dataframe())
+    with open(VIZ_CACHE, 'wb') as f:
+        pickle.dump((source_mtime, viz_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return viz_data
+
 def main():
-    # Load and process data
-    data = load_data()
-    processed_data = process_data(data)
-    viz_data = create_visualizations(processed_data)
-    
-    # Create and run the app
-    app = create_app(viz_data)
-    
-    # Get port from environment variable or use default
-    port = int(os.environ.get('PORT', 8050))
-    
-    if __name__ == '__main__':
-        print(f"Starting Dash server on port {port}")
-        app.run_server(host='0.0.0.0', port=port, debug=False)
-    
-    return app
+    # Load and process data in a single streaming pass (cached across restarts)
+    viz_data = _load_viz_data()
+    return create_app(viz_data)
 
 # Create the app instance
 app = main()
 server = app.server  # Expose server variable for render.com
 
 if __name__ == "__main__":
-    app.run_server(debug=False)
+    port = int(os.environ.get('PORT', 8050))
+    print(f"Starting server on port {port}")
+    # Flask의 단일 스레드 개발 서버 대신 waitress로 동시 요청을 처리한다
+    serve(server, host='0.0.0.0', port=port, threads=8)